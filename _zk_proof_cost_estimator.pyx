@@ -0,0 +1,45 @@
+# cython: language_level=3
+"""
+Optional compiled kernel for zk_proof_cost_estimator.estimate_cost.
+
+Mirrors zk_proof_cost_estimator._estimate_core exactly; the module falls
+back to that kernel when this extension is not built. Division keeps
+Python semantics, so bs == 0 raises ZeroDivisionError. _compute only calls
+this with tx + bs - 1 within long long range.
+"""
+
+
+cpdef tuple estimate_core(
+    double base_ms_sec,
+    double base_usd_sec,
+    double scaling,
+    long long tx,
+    long long bs,
+    double hw,
+):
+    cdef long long batches = (tx + bs - 1) // bs
+
+    # Efficiency improvement/degradation depending on size
+    cdef double volume_factor = scaling + (<double>tx / 10000.0) * 0.02
+    # Same as max(0.5, min(1.25, x)) in the Python kernel, NaN -> 1.25 included
+    if not volume_factor < 1.25:
+        volume_factor = 1.25
+    elif volume_factor < 0.5:
+        volume_factor = 0.5
+
+    cdef double per_proof_ms = base_ms_sec / hw * volume_factor
+    cdef double per_proof_usd = base_usd_sec / hw * volume_factor
+
+    cdef double total_ms = per_proof_ms * batches
+    cdef double total_usd = per_proof_usd * batches
+
+    return (
+        per_proof_ms,
+        per_proof_usd,
+        total_ms,
+        total_usd,
+        total_ms / tx,
+        total_usd / tx,
+        volume_factor,
+        batches,
+    )
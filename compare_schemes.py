@@ -17,28 +17,44 @@ def parse_args():
                    help="ETH price in USD (e.g. 3200).")
     return p.parse_args()
 
-def estimate_cost(num_proofs, gas_per_proof, gas_price_gwei, eth_price_usd):
-    total_gas = num_proofs * gas_per_proof
-    total_eth = total_gas * gas_price_gwei * 1e-9  # gwei->ETH
-    total_usd = total_eth * eth_price_usd
+def estimate_costs(num_proofs, gas_per_proof, gas_price_gwei, eth_price_usd):
+    """Totals for every scheme in gas_per_proof, as parallel lists."""
+    eth_per_gas = gas_price_gwei * 1e-9  # gwei->ETH
+    usd_per_gas = eth_per_gas * eth_price_usd
+    total_gas, total_eth, total_usd = [], [], []
+    for g in gas_per_proof:
+        gas = num_proofs * g  # exact int
+        total_gas.append(gas)
+        total_eth.append(gas * eth_per_gas)
+        total_usd.append(gas * usd_per_gas)
     return total_gas, total_eth, total_usd
 
+def estimate_cost(num_proofs, gas_per_proof, gas_price_gwei, eth_price_usd):
+    """Single-scheme (total_gas, total_eth, total_usd); see estimate_costs."""
+    (gas,), (eth,), (usd,) = estimate_costs(
+        num_proofs, (gas_per_proof,), gas_price_gwei, eth_price_usd
+    )
+    return gas, eth, usd
+
 def main():
     args = parse_args()
     num = args.num_proofs
     gas_price = args.gas_price_gwei
     eth_usd = args.eth_price_usd
 
-    gas_a, eth_a, usd_a = estimate_cost(num, args.gas_per_proof_a, gas_price, eth_usd)
-    gas_b, eth_b, usd_b = estimate_cost(num, args.gas_per_proof_b, gas_price, eth_usd)
+    gpp = (args.gas_per_proof_a, args.gas_per_proof_b)
+    total_gas, total_eth, total_usd = estimate_costs(num, gpp, gas_price, eth_usd)
+    gas_a, gas_b = total_gas
+    eth_a, eth_b = total_eth
+    usd_a, usd_b = total_usd
 
     print("Scheme A:")
-    print(f"  Gas per proof      : {args.gas_per_proof_a:,} gas")
+    print(f"  Gas per proof      : {gpp[0]:,} gas")
     print(f"  Total gas (A)      : {gas_a:,} gas")
     print(f"  Total cost (A)     : {eth_a:.6f} ETH ≈ ${usd_a:,.2f}")
 
     print("\nScheme B:")
-    print(f"  Gas per proof      : {args.gas-per_proof_b:,} gas")
+    print(f"  Gas per proof      : {gpp[1]:,} gas")
     print(f"  Total gas (B)      : {gas_b:,} gas")
     print(f"  Total cost (B)     : {eth_b:.6f} ETH ≈ ${usd_b:,.2f}")
 
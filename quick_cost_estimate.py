@@ -25,9 +25,12 @@ def main() -> None:
     gas_price_gwei = args.gas_price_gwei
     eth_price = args.eth_price_usd
 
-    total_gas = num * gas_per                     # gas
-    total_eth = total_gas * gas_price_gwei * 1e-9  # gwei -> ETH
-    total_usd = total_eth * eth_price
+    eth_per_gas = gas_price_gwei * 1e-9           # gwei -> ETH
+    usd_per_gas = eth_per_gas * eth_price
+
+    total_gas = num * gas_per                     # gas, exact int
+    total_eth = total_gas * eth_per_gas
+    total_usd = total_gas * usd_per_gas
 
     print(f"Number of proofs      : {num}")
     print(f"Gas per proof         : {gas_per:,} gas")
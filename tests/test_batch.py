@@ -0,0 +1,48 @@
+"""estimate_cost_batch against the scalar estimate_cost."""
+import pytest
+
+import zk_proof_cost_estimator as zpce
+
+np = pytest.importorskip("numpy")
+
+
+def test_batch_matches_scalar():
+    idx = [0, 1, 2]
+    tx = [12000, 20000, 8000]
+    sec = [256, 192, 128]
+    hw = [1.0, 2.0, 1.0]
+    out = zpce.estimate_cost_batch(idx, tx, 512, sec, hw)
+    for i, key in enumerate(zpce.SYSTEM_KEYS):
+        est = zpce.estimate_cost(zpce.SYSTEMS[key], tx[i], 512, sec[i], hw[i])
+        assert out["batches"][i] == est.batches
+        assert out["totalUsd"][i] == pytest.approx(est.totalUsd)
+        assert out["perTxMs"][i] == pytest.approx(est.perTxMs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"systems_idx": [0.9]},
+        {"tx_count": [10.7]},
+        {"batch_size": [512.0]},
+        {"security_bits": [128.9]},
+    ],
+)
+def test_batch_rejects_non_integral(kwargs):
+    args = {
+        "systems_idx": [0],
+        "tx_count": [1000],
+        "batch_size": [512],
+        "security_bits": [128],
+        "hardware_scale": [1.0],
+    }
+    args.update(kwargs)
+    with pytest.raises(ValueError, match="must be integers"):
+        zpce.estimate_cost_batch(**args)
+
+
+def test_batch_count_near_int64_max():
+    tx = 2**63 - 1
+    out = zpce.estimate_cost_batch([0], [tx], [512], [128], [1.0])
+    assert out["batches"][0] == (tx + 511) // 512
+    assert out["totalMs"][0] > 0
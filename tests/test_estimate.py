@@ -0,0 +1,31 @@
+"""estimate_cost with profiles that are not the stock SYSTEMS entries."""
+import pytest
+
+import zk_proof_cost_estimator as zpce
+
+
+def test_replaced_profile_uses_its_own_costs(monkeypatch):
+    stock = zpce.estimate_cost(zpce.SYSTEMS["aztec"], 1000, 512, 128, 1.0)
+    cheap = zpce.SYSTEMS["aztec"]._replace(base_ms_per_proof=1.0)
+    monkeypatch.setitem(zpce.SYSTEMS, "aztec", cheap)
+
+    est = zpce.estimate_cost(cheap, 1000, 512, 128, 1.0)
+    assert est.perProofMs == pytest.approx(stock.perProofMs / 420.0)
+    assert est.perProofUsd == stock.perProofUsd
+
+
+def test_profile_registered_after_import(monkeypatch):
+    custom = zpce.ProvingSystem(
+        key="x",
+        name="Custom",
+        family="zk-stark",
+        description="Registered at runtime.",
+        base_ms_per_proof=100.0,
+        base_usd_per_proof=0.1,
+        scaling_factor=0.8,
+    )
+    monkeypatch.setitem(zpce.SYSTEMS, "x", custom)
+
+    est = zpce.estimate_cost(custom, 1000, 512, 192, 1.0)
+    assert est.systemName == "Custom"
+    assert est.perProofMs == pytest.approx(100.0 * 1.35 * 0.802)
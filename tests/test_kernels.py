@@ -0,0 +1,88 @@
+"""Parity checks between the Python, numba and Cython estimate kernels."""
+import math
+import random
+
+import pytest
+
+import zk_proof_cost_estimator as zpce
+
+def _random_args(n=2000):
+    rng = random.Random(0)
+    return [
+        (
+            rng.uniform(1.0, 1000.0),
+            rng.uniform(0.01, 1.0),
+            rng.uniform(0.3, 1.3),
+            rng.randint(1, 10**12),
+            rng.randint(1, 10**6),
+            rng.uniform(0.1, 10.0),
+        )
+        for _ in range(n)
+    ]
+
+
+# Clamp boundaries, non-finite floats and the largest int64-safe tx.
+EDGE_ARGS = [
+    (420.0, 0.18, math.nan, 1000, 512, 1.0),
+    (420.0, 0.18, math.inf, 1000, 512, 1.0),
+    (420.0, 0.18, -math.inf, 1000, 512, 1.0),
+    (420.0, 0.18, 1.25, 1, 1, 1.0),
+    (420.0, 0.18, 0.5, 1, 1, 1.0),
+    (420.0, 0.18, -5.0, 1, 1, 1.0),
+    (420.0, 0.18, 0.85, 1, 1, math.inf),
+    (420.0, 0.18, 0.85, 1000, 512, math.nan),
+    (420.0, 0.18, 0.85, 2**63 - 512, 512, 1.0),
+    (420.0, 0.18, 0.85, 2**53 + 1, 3, 1e-300),
+]
+
+ARGS = _random_args() + EDGE_ARGS
+
+
+def _same(a, b):
+    """Tuple equality that treats NaN as equal to NaN."""
+    return len(a) == len(b) and all(
+        x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(a, b)
+    )
+
+
+def test_cython_kernel_matches_python():
+    ext = pytest.importorskip("_zk_proof_cost_estimator")
+    for args in ARGS:
+        assert _same(ext.estimate_core(*args), zpce._estimate_core(*args)), args
+
+
+def test_cython_kernel_zero_batch_size_raises():
+    ext = pytest.importorskip("_zk_proof_cost_estimator")
+    with pytest.raises(ZeroDivisionError):
+        ext.estimate_core(420.0, 0.18, 0.85, 1000, 0, 1.0)
+
+
+def test_numba_kernel_matches_python(monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(zpce, "estimate_core", zpce.estimate_core)
+    assert zpce.use_numba()
+    jitted = zpce.estimate_core
+    assert jitted.py_func is zpce._estimate_core
+    for args in ARGS:
+        assert _same(jitted(*args), jitted.py_func(*args)), args
+
+
+def test_estimate_cost_beyond_int64_is_exact():
+    tx = 2**63 - 1
+    est = zpce.estimate_cost(zpce.SYSTEMS["aztec"], tx, 512, 128, 1.0)
+    assert est.batches == (tx + 511) // 512
+
+    est = zpce.estimate_cost(zpce.SYSTEMS["aztec"], 10**20, 512, 128, 1.0)
+    assert est.batches == (10**20 + 511) // 512
+
+
+def test_estimate_cost_rejects_non_integral_counts():
+    with pytest.raises(ValueError, match="tx_count must be an integer"):
+        zpce.estimate_cost(zpce.SYSTEMS["aztec"], 1000.7, 512, 128, 1.0)
+    with pytest.raises(ValueError, match="batch_size must be an integer"):
+        zpce.estimate_cost(zpce.SYSTEMS["aztec"], 1000, 512.0, 128, 1.0)
+
+
+def test_python_kernel_clamps_nan_scaling_high():
+    # Baseline clamp order max(lo, min(hi, x)) maps NaN to the upper bound.
+    assert zpce._estimate_core(420.0, 0.18, math.nan, 1000, 512, 1.0)[6] == 1.25
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+zk_proof_cost_estimator — offline cost & latency estimator for different zk/FHE proving profiles.
+"""
+import argparse
+import json
+import operator
+import sys
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for estimate_cost_batch
+    np = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used instead
+    orjson = None
+
+
+class ProvingSystem(NamedTuple):
+    """Static profile for a proving system used for rough cost estimation."""
+    key: str
+    name: str
+    family: str
+    description: str
+    base_ms_per_proof: float      # milliseconds at 128-bit security
+    base_usd_per_proof: float     # abstract cost in USD at 128-bit
+    scaling_factor: float         # scaling per 10k tx (efficiency factor)
+
+
+SYSTEMS: Dict[str, ProvingSystem] = {
+    "aztec": ProvingSystem(
+        key="aztec",
+        name="Aztec-style zk SNARK System",
+        family="zk-snark",
+        description="Privacy-focused zk rollup proving for encrypted state and contracts.",
+        base_ms_per_proof=420.0,
+        base_usd_per_proof=0.18,
+        scaling_factor=0.85,
+    ),
+    "zama": ProvingSystem(
+        key="zama",
+        name="Zama-style FHE + Proof Hybrid",
+        family="fhe-hybrid",
+        description="FHE-heavy design where zk proofs attest to encrypted compute pipelines.",
+        base_ms_per_proof=780.0,
+        base_usd_per_proof=0.35,
+        scaling_factor=0.72,
+    ),
+    "soundness": ProvingSystem(
+        key="soundness",
+        name="Soundness-first Minimal Circuit System",
+        family="verified-zk",
+        description="Formally specified circuits tuned for clarity and soundness over raw speed.",
+        base_ms_per_proof=500.0,
+        base_usd_per_proof=0.22,
+        scaling_factor=0.90,
+    ),
+}
+
+
+SECURITY_LEVELS: Dict[int, float] = {
+    128: 1.0,
+    192: 1.35,
+    256: 1.70,
+}
+
+_SEC_KEYS = frozenset(SECURITY_LEVELS)
+_SEC_KEYS_SORTED = tuple(sorted(SECURITY_LEVELS))
+
+
+class Estimate(NamedTuple):
+    """Unrounded result of estimate_cost; round via asdict_rounded or format specs."""
+    system: str
+    systemName: str
+    family: str
+    description: str
+    securityBits: int
+    txCount: int
+    batchSize: int
+    batches: int
+    hardwareScale: float
+    perProofMs: float
+    perProofUsd: float
+    totalMs: float
+    totalUsd: float
+    perTxMs: float
+    perTxUsd: float
+    volumeFactor: float
+
+
+# Decimal places applied to Estimate fields on output.
+ROUNDING: Dict[str, int] = {
+    "perProofMs": 3,
+    "perProofUsd": 6,
+    "totalMs": 3,
+    "totalUsd": 6,
+    "perTxMs": 5,
+    "perTxUsd": 8,
+    "volumeFactor": 4,
+}
+
+
+# Security-scaled base costs per (profile, security bits): (ms, usd).
+# Keyed on the ProvingSystem tuple itself, so profiles edited or registered
+# after import simply miss and are scaled from their own fields.
+PRECOMPUTED: Dict[Tuple[ProvingSystem, int], Tuple[float, float]] = {
+    (system, bits): (system.base_ms_per_proof * factor, system.base_usd_per_proof * factor)
+    for system in SYSTEMS.values()
+    for bits, factor in SECURITY_LEVELS.items()
+}
+
+
+# Registered system keys; estimate_cost_batch takes positions in this tuple.
+SYSTEM_KEYS = tuple(SYSTEMS.keys())
+
+if np is not None:
+    # Per-system parameters as arrays indexed by position in SYSTEM_KEYS.
+    BASE_MS = np.array([SYSTEMS[k].base_ms_per_proof for k in SYSTEM_KEYS], dtype=np.float64)
+    BASE_USD = np.array([SYSTEMS[k].base_usd_per_proof for k in SYSTEM_KEYS], dtype=np.float64)
+    SCALING = np.array([SYSTEMS[k].scaling_factor for k in SYSTEM_KEYS], dtype=np.float64)
+    SEC_BITS = np.array(_SEC_KEYS_SORTED, dtype=np.int64)
+    SEC_FACTOR_LUT = np.array([SECURITY_LEVELS[b] for b in _SEC_KEYS_SORTED], dtype=np.float64)
+
+
+def _estimate_core(base_ms_sec, base_usd_sec, scaling, tx, bs, hw):
+    """Numeric kernel of estimate_cost; base costs are already security-scaled."""
+    batches = (tx + bs - 1) // bs
+
+    # Efficiency improvement/degradation depending on size
+    volume_factor = max(0.5, min(1.25, scaling + (tx / 10_000) * 0.02))
+
+    per_proof_ms = base_ms_sec / hw * volume_factor
+    per_proof_usd = base_usd_sec / hw * volume_factor
+
+    total_ms = per_proof_ms * batches
+    total_usd = per_proof_usd * batches
+
+    per_tx_ms = total_ms / tx
+    per_tx_usd = total_usd / tx
+
+    return (
+        per_proof_ms,
+        per_proof_usd,
+        total_ms,
+        total_usd,
+        per_tx_ms,
+        per_tx_usd,
+        volume_factor,
+        batches,
+    )
+
+
+try:
+    from _zk_proof_cost_estimator import estimate_core
+except ImportError:  # compiled extension not built; see _zk_proof_cost_estimator.pyx
+    estimate_core = _estimate_core
+
+# Compiled kernels use int64, so tx + batch_size - 1 must stay within it.
+_INT64_MAX = 2**63 - 1
+
+
+def use_numba() -> bool:
+    """
+    Switch estimate_cost to a numba-JIT build of the kernel.
+
+    numba is imported here rather than at module load so one-shot CLI runs
+    don't pay for it. Returns False, keeping the current kernel, when numba
+    is not installed.
+    """
+    global estimate_core
+    try:
+        from numba import njit
+    except ImportError:
+        return False
+    estimate_core = njit(cache=True)(_estimate_core)
+    return True
+
+
+def _as_int(name: str, value) -> int:
+    """value as an int; non-integral input is rejected, not truncated."""
+    try:
+        return operator.index(value)
+    except TypeError:
+        raise ValueError(f"{name} must be an integer.") from None
+
+
+def estimate_cost(
+    system: ProvingSystem,
+    tx_count: int,
+    batch_size: int,
+    security_bits: int,
+    hardware_scale: float,
+) -> Estimate:
+    tx_count = _as_int("tx_count", tx_count)
+    batch_size = _as_int("batch_size", batch_size)
+    if tx_count <= 0:
+        raise ValueError("tx_count must be positive.")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive.")
+    if security_bits not in _SEC_KEYS:
+        raise ValueError(f"security_bits must be one of {_SEC_KEYS_SORTED}.")
+    if hardware_scale <= 0:
+        raise ValueError("hardware_scale must be > 0.")
+
+    return _compute(system, tx_count, batch_size, security_bits, hardware_scale)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _compute(system: ProvingSystem, tx: int, bs: int, sec: int, hw: float) -> Estimate:
+    """
+    Memoized body of estimate_cost for pre-validated arguments.
+
+    The cache is keyed on the ProvingSystem tuple itself, so custom or edited
+    profiles are costed from their own fields. Estimate is immutable, so
+    cached results are shared safely. Floats only hit the cache on exact
+    equality, which suits discrete UI/sweep steps.
+    """
+    precomputed = PRECOMPUTED.get((system, sec))
+    if precomputed is not None:
+        base_ms_sec, base_usd_sec = precomputed
+    else:
+        sec_factor = SECURITY_LEVELS[sec]
+        base_ms_sec = system.base_ms_per_proof * sec_factor
+        base_usd_sec = system.base_usd_per_proof * sec_factor
+
+    (
+        per_proof_ms,
+        per_proof_usd,
+        total_ms,
+        total_usd,
+        per_tx_ms,
+        per_tx_usd,
+        volume_factor,
+        batches,
+    ) = (estimate_core if tx + bs - 1 <= _INT64_MAX else _estimate_core)(
+        base_ms_sec,
+        base_usd_sec,
+        system.scaling_factor,
+        tx,
+        bs,
+        hw,
+    )
+
+    return Estimate(
+        system.key,
+        system.name,
+        system.family,
+        system.description,
+        sec,
+        tx,
+        bs,
+        batches,
+        hw,
+        per_proof_ms,
+        per_proof_usd,
+        total_ms,
+        total_usd,
+        per_tx_ms,
+        per_tx_usd,
+        volume_factor,
+    )
+
+
+def asdict_rounded(est: Estimate) -> Dict[str, Any]:
+    """Estimate as a dict with the output precision from ROUNDING applied."""
+    out = est._asdict()
+    for field, ndigits in ROUNDING.items():
+        out[field] = round(out[field], ndigits)
+    return out
+
+
+def _int_array(name: str, values, dtype):
+    """values as an integer array; non-integral input is rejected, not truncated."""
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.integer):
+        raise ValueError(f"{name} must be integers.")
+    return arr.astype(dtype, copy=False)
+
+
+def estimate_cost_batch(
+    systems_idx,
+    tx_count,
+    batch_size,
+    security_bits,
+    hardware_scale,
+) -> Dict[str, Any]:
+    """
+    Vectorized estimate_cost over 1-D arrays (scalars broadcast).
+
+    systems_idx indexes SYSTEM_KEYS. Returns a dict of unrounded arrays
+    keyed like the estimate_cost summary.
+    """
+    if np is None:
+        raise RuntimeError("estimate_cost_batch requires numpy.")
+
+    idx = _int_array("systems_idx", systems_idx, np.intp)
+    tx = _int_array("tx_count", tx_count, np.int64)
+    bs = _int_array("batch_size", batch_size, np.int64)
+    sec = _int_array("security_bits", security_bits, np.int64)
+    hw = np.asarray(hardware_scale, dtype=np.float64)
+
+    if np.any((idx < 0) | (idx >= len(SYSTEM_KEYS))):
+        raise ValueError(f"systems_idx must be in range(0, {len(SYSTEM_KEYS)}).")
+    if np.any(tx <= 0):
+        raise ValueError("tx_count must be positive.")
+    if np.any(bs <= 0):
+        raise ValueError("batch_size must be positive.")
+    if not np.all(np.isin(sec, SEC_BITS)):
+        raise ValueError(f"security_bits must be one of {_SEC_KEYS_SORTED}.")
+    if np.any(hw <= 0):
+        raise ValueError("hardware_scale must be > 0.")
+
+    batches = (tx - 1) // bs + 1  # ceil division that cannot overflow int64
+    sec_factor = SEC_FACTOR_LUT[np.searchsorted(SEC_BITS, sec)]
+    volume_factor = np.clip(SCALING[idx] + tx * 2e-6, 0.5, 1.25)
+
+    scale = sec_factor / hw * volume_factor
+    per_proof_ms = BASE_MS[idx] * scale
+    per_proof_usd = BASE_USD[idx] * scale
+
+    total_ms = per_proof_ms * batches
+    total_usd = per_proof_usd * batches
+
+    return {
+        "systemIdx": idx,
+        "securityBits": sec,
+        "txCount": tx,
+        "batchSize": bs,
+        "batches": batches,
+        "hardwareScale": hw,
+        "perProofMs": per_proof_ms,
+        "perProofUsd": per_proof_usd,
+        "totalMs": total_ms,
+        "totalUsd": total_usd,
+        "perTxMs": total_ms / tx,
+        "perTxUsd": total_usd / tx,
+        "volumeFactor": volume_factor,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="zk_proof_cost_estimator",
+        description=(
+            "Offline zk/FHE proof cost estimator inspired by Aztec-style zk rollups, "
+            "Zama-style FHE hybrids, and soundness-first proving systems."
+        ),
+    )
+    parser.add_argument(
+        "tx_count",
+        type=int,
+        help="Number of transactions you plan to prove.",
+    )
+    parser.add_argument(
+        "--system",
+        choices=list(SYSTEMS.keys()),
+        default="aztec",
+        help="Proving system profile (default: aztec).",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=512,
+        help="Transactions per proof/batch (default: 512).",
+    )
+    parser.add_argument(
+        "--security-bits",
+        type=int,
+        choices=_SEC_KEYS_SORTED,
+        default=128,
+        help="Security level in bits (default: 128).",
+    )
+    parser.add_argument(
+        "--hardware-scale",
+        type=float,
+        default=1.0,
+        help="Relative hardware scale factor; >1 for better hardware (default: 1.0).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print JSON instead of human-readable text.",
+    )
+    return parser.parse_args()
+
+
+def print_human(summary: Estimate) -> None:
+    buf = (
+        "🧮 zk_proof_cost_estimator\n"
+        f"System        : {summary.systemName} ({summary.system})\n"
+        f"Family        : {summary.family}\n"
+        f"Description   : {summary.description}\n"
+        "\n"
+        f"Transactions  : {summary.txCount}\n"
+        f"Batch size    : {summary.batchSize}\n"
+        f"Batches       : {summary.batches}\n"
+        f"Security bits : {summary.securityBits}\n"
+        f"Hardware x    : {summary.hardwareScale}\n"
+        f"Volume factor : {round(summary.volumeFactor, ROUNDING['volumeFactor'])}\n"
+        "\n"
+        "Per-proof estimate:\n"
+        f"  Time        : {summary.perProofMs:.3f} ms\n"
+        f"  Cost        : ${summary.perProofUsd:.6f}\n"
+        "\n"
+        "Per-transaction estimate:\n"
+        f"  Time        : {summary.perTxMs:.5f} ms/tx\n"
+        f"  Cost        : ${summary.perTxUsd:.8f} per tx\n"
+        "\n"
+        "Total estimate:\n"
+        f"  Time        : {summary.totalMs:.3f} ms\n"
+        f"  Cost        : ${summary.totalUsd:.6f}\n"
+    )
+    sys.stdout.write(buf)
+    sys.stdout.flush()
+
+
+def dumps_json(data: Dict[str, Any]) -> str:
+    """
+    Indented, key-sorted JSON; uses orjson when it is installed.
+
+    orjson writes small floats in shortest form (1.89e-6 rather than
+    1.89e-06) and cannot encode ints beyond 64 bits, for which this falls
+    back to the stdlib json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
+def main() -> None:
+    args = parse_args()
+    if args.tx_count <= 0:
+        print("❌ tx_count must be positive.", flush=True)
+        raise SystemExit(1)
+
+    system = SYSTEMS[args.system]
+
+    try:
+        summary = estimate_cost(
+            system=system,
+            tx_count=args.tx_count,
+            batch_size=args.batch_size,
+            security_bits=args.security_bits,
+            hardware_scale=args.hardware_scale,
+        )
+    except ValueError as exc:
+        print(f"❌ {exc}")
+        raise SystemExit(1)
+
+    if args.json:
+        sys.stdout.write(dumps_json(asdict_rounded(summary)) + "\n")
+        sys.stdout.flush()
+    else:
+        print_human(summary)
+
+
+if __name__ == "__main__":
+    main()